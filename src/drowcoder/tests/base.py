@@ -7,6 +7,7 @@ consistent reports with git-aware naming.
 Key Functions:
 - get_git_info(): Get git commit SHA and dirty status
 - generate_report_name(): Generate git-aware report filenames
+- format_report_header(): Format the header at the top of a report
 - run_tests_with_report(): Run pytest and generate reports automatically
 
 Usage:
@@ -19,17 +20,28 @@ Usage:
 This ensures consistent report generation across all agent tests.
 """
 
+import shutil
 import subprocess
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Tuple, Optional
 
 
+# Separator line of report headers and console summaries
+SEPARATOR = '=' * 70
+
+
+@lru_cache(maxsize=1)
 def get_git_info() -> Tuple[Optional[str], bool, bool]:
     """
     Get current git commit SHA and dirty status.
 
+    A single `git status` call reports both, and the result is cached for the
+    rest of the process.
+
     Returns:
         tuple: (commit_sha8, is_dirty, git_available)
             - commit_sha8: 8-character commit SHA, or None if git unavailable
@@ -37,27 +49,25 @@ def get_git_info() -> Tuple[Optional[str], bool, bool]:
             - git_available: True if git is available and in a git repo
     """
     try:
-        # Get current commit SHA (8 characters)
+        # Header lines ('# branch.*') carry the commit SHA; any other line is a change
         result = subprocess.run(
-            ['git', 'rev-parse', '--short=8', 'HEAD'],
+            ['git', 'status', '--porcelain=v2', '--branch'],
             capture_output=True,
             text=True,
             check=True,
             timeout=5
         )
-        commit_sha = result.stdout.strip()
+        lines = result.stdout.splitlines()
+
+        # Get current commit SHA (8 characters); a repo without commits has none
+        commit_sha = next((line.split()[2] for line in lines if line.startswith('# branch.oid ')), None)
+        if commit_sha is None or commit_sha == '(initial)':
+            return None, False, False
 
         # Check if working directory is dirty
-        result = subprocess.run(
-            ['git', 'status', '--porcelain'],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5
-        )
-        is_dirty = bool(result.stdout.strip())
+        is_dirty = any(not line.startswith('#') for line in lines)
 
-        return commit_sha, is_dirty, True
+        return commit_sha[:8], is_dirty, True
 
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         return None, False, False
@@ -89,6 +99,42 @@ def generate_report_name(test_name: str, commit_sha: Optional[str], is_dirty: bo
         return f"report_{test_name}.{extension}"
 
 
+def format_report_header(
+    test_name: str,
+    commit_sha: Optional[str],
+    is_dirty: bool,
+    git_available: bool,
+    exit_code: int,
+    extra: str = '',
+) -> str:
+    """
+    Format the header written at the top of a report.
+
+    Args:
+        test_name: Name of the test being run
+        commit_sha: Git commit SHA (8 chars), or None
+        is_dirty: Whether working directory has uncommitted changes
+        git_available: Whether git is available and in a git repo
+        exit_code: Exit code of the test run
+        extra: Additional header lines (each ending in a newline), placed
+            before the closing separator
+
+    Returns:
+        str: Report header, ending in a blank line
+    """
+    return f"""{SEPARATOR}
+Test Report
+{SEPARATOR}
+Test: {test_name}
+Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Git Commit: {commit_sha if git_available else 'N/A'}
+Working Dir: {'dirty (uncommitted changes)' if is_dirty else 'clean'}
+Exit Code: {exit_code}
+{extra}{SEPARATOR}
+
+"""
+
+
 def run_tests_with_report(test_file: str, test_name: str) -> int:
     """
     Run pytest tests and generate a report with git-aware naming.
@@ -127,55 +173,57 @@ def run_tests_with_report(test_file: str, test_name: str) -> int:
     else:
         print("Git not available, using timestamp-based naming")
     print(f"Report will be saved to: {report_path}")
-    print("=" * 70)
+    print(SEPARATOR)
     print()
 
-    # Run pytest and capture output
-    result = subprocess.run(
-        ['pytest', test_file, '-v', '--tb=short', '--no-cov'],
-        capture_output=True,
-        text=True
-    )
+    # Run pytest, echoing its output as it comes and spooling it to disk rather
+    # than holding it in memory (the report header needs the exit code first)
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as stdout_spool, \
+            tempfile.TemporaryFile('w+') as stderr_spool:
+        process = subprocess.Popen(
+            ['pytest', test_file, '-v', '--tb=short', '--no-cov'],
+            stdout=subprocess.PIPE,
+            stderr=stderr_spool,
+            text=True
+        )
+        with process.stdout:
+            for line in process.stdout:
+                sys.stdout.write(line)
+                stdout_spool.write(line)
+        returncode = process.wait()
 
-    # Generate report header
-    header = f"""{'=' * 70}
-Test Report
-{'=' * 70}
-Test: {test_name}
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Git Commit: {commit_sha if git_available else 'N/A'}
-Working Dir: {'dirty (uncommitted changes)' if is_dirty else 'clean'}
-Exit Code: {result.returncode}
-{'=' * 70}
+        stderr_spool.seek(0)
+        stderr = stderr_spool.read()
 
-"""
+        header = format_report_header(test_name, commit_sha, is_dirty, git_available, returncode)
 
-    # Write report to file
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(header)
-        f.write(result.stdout)
-        if result.stderr:
-            f.write("\n\n=== STDERR ===\n" + result.stderr)
+        # Write report to file
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(header)
+            stdout_spool.seek(0)
+            shutil.copyfileobj(stdout_spool, f)
+            if stderr:
+                f.write("\n\n=== STDERR ===\n" + stderr)
 
     # Print to console
-    print(result.stdout)
-    if result.stderr:
+    print()
+    if stderr:
         print("\n=== STDERR ===")
-        print(result.stderr)
+        print(stderr)
 
     # Print report location
     print()
-    print("=" * 70)
-    if result.returncode == 0:
+    print(SEPARATOR)
+    if returncode == 0:
         print(f"✅ All tests passed!")
     else:
-        print(f"❌ Some tests failed (exit code: {result.returncode})")
+        print(f"❌ Some tests failed (exit code: {returncode})")
     print(f"📄 Report saved: {report_path}")
-    print("=" * 70)
+    print(SEPARATOR)
 
-    return result.returncode
+    return returncode
 
 
 # For compatibility
-__all__ = ['get_git_info', 'generate_report_name', 'run_tests_with_report']
+__all__ = ['get_git_info', 'generate_report_name', 'format_report_header', 'run_tests_with_report']
 
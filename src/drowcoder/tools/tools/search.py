@@ -11,6 +11,7 @@ This module provides file content search functionality with:
 
 import os
 import re
+import stat
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Optional, Union
@@ -24,6 +25,19 @@ from .utils.ignore import IgnoreController
 
 TOOL_NAME = 'search'
 
+# Read buffer for streaming file contents (1 MiB instead of the default 8 KiB)
+READ_BUFFER_SIZE = 1 << 20
+
+# Files below this size are read in one shot rather than streamed line by line
+SMALL_FILE_SIZE = 64 << 10
+
+# Characters that give a content pattern regex semantics; a pattern without any
+# of them is a plain literal and can be matched with a substring test instead
+REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+# Any byte outside ASCII; a buffer without one is valid UTF-8 as it stands
+NON_ASCII_BYTE = re.compile(rb'[\x80-\xff]')
+
 @dataclass
 class LineMeta:
     """
@@ -110,6 +124,19 @@ class PathTreeNodeForSearchTool(PathTreeNode):
             self.children[child_name] = PathTreeNodeForSearchTool(child_name, is_leaf, meta or {})
         return self.children[child_name]
 
+    def sort_children(self) -> None:
+        """
+        Reorder the children of this node and all its descendants by name.
+
+        Called once after the tree is built, so formatting can iterate
+        children in name order without sorting them on every visit.
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node.children = dict(sorted(node.children.items(), key=lambda item: item[1].name))
+            stack.extend(node.children.values())
+
 
 class PathTreeForSearchTool(PathTree):
     """
@@ -163,25 +190,28 @@ class PathTreeForSearchTool(PathTree):
         if node is None:
             node = self.root
 
-        # Build the tree line
-        tree_symbol = "└── " if prefix else ""
-        formatted_str = prefix + tree_symbol + node.name + "\n"
+        # Walk the tree depth-first with an explicit stack so deep trees don't
+        # hit the recursion limit, collecting lines into a buffer joined once
+        formatted_lines = []
+        stack = [(node, prefix)]
+        while stack:
+            node, prefix = stack.pop()
 
-        if not only_filename and node.is_leaf and node.meta:
-            formatted_str += node.meta.format_matches(
-                prefix + " " * len(tree_symbol),
-                max_matches_per_file,
-            )
+            # Build the tree line
+            tree_symbol = "└── " if prefix else ""
+            formatted_lines.append(prefix + tree_symbol + node.name + "\n")
 
-        children = sorted(node.children.values(), key=lambda x: x.name)
-        for i, child in enumerate(children):
-            formatted_str += self.format(
-                child,
-                prefix + "    ",
-                only_filename,
-                max_matches_per_file,
-            )
-        return formatted_str
+            if not only_filename and node.is_leaf and node.meta:
+                formatted_lines.append(node.meta.format_matches(
+                    prefix + " " * len(tree_symbol),
+                    max_matches_per_file,
+                ))
+
+            # Children are kept sorted by name (see sort_children); push them in
+            # reverse so they are popped in order
+            stack.extend((child, prefix + "    ") for child in reversed(node.children.values()))
+
+        return ''.join(formatted_lines)
 
 
 class TreeGraphForSearchTool(TreeGraph):
@@ -213,11 +243,20 @@ class TreeGraphForSearchTool(TreeGraph):
         for path_meta in paths:
             path = path_meta.file
             if isinstance(path, str):
-                path_meta.file = list(Path(path).parts)
+                # Split with plain string ops rather than building a PurePath per file
+                drive, rest = os.path.splitdrive(os.path.normpath(path))
+                parts = [part for part in rest.split(os.sep) if part]
+                if rest.startswith(os.sep):
+                    # Keep the root as the first component, as Path.parts does
+                    parts.insert(0, drive + os.sep)
+                elif drive:
+                    parts.insert(0, drive)
+                path_meta.file = parts
             tree.add_path(path_meta)
 
         if concentrate:
             tree.root.concentrate()
+        tree.root.sort_children()
 
         return tree
 
@@ -309,14 +348,18 @@ class SearchTool(BaseTool):
         try:
             # Handle cwd
             cwd = Path(cwd or os.getcwd()).expanduser().resolve()
-            if not cwd.exists():
+            try:
+                cwd_stat = os.stat(cwd)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Working directory does not exist: {cwd}")
-            if not cwd.is_dir():
+            if not stat.S_ISDIR(cwd_stat.st_mode):
                 raise ValueError(f"Working directory is not a directory: {cwd}")
 
-            # Handle path
+            # Handle path (stat once and reuse the mode for the file/dir dispatch below)
             search_path = Path(path).expanduser().resolve()
-            if not search_path.exists():
+            try:
+                search_path_stat = os.stat(search_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Path does not exist: {search_path}")
 
             path_is_within_cwd = self._is_within_workspace(str(search_path), str(cwd))
@@ -341,14 +384,14 @@ class SearchTool(BaseTool):
                     return False
 
             # Determine files to search
-            if search_path.is_file():
+            if stat.S_ISREG(search_path_stat.st_mode):
                 # Check single file against ignore patterns
                 if is_file_ignored(search_path):
                     files_to_search = []
                 else:
                     files_to_search = [str(search_path)]
 
-            elif search_path.is_dir():
+            elif stat.S_ISDIR(search_path_stat.st_mode):
                 # Use Path rglob with smart exclusion patterns
                 base_path = Path(search_path)
                 files_to_search = []
@@ -388,14 +431,30 @@ class SearchTool(BaseTool):
                 # Re-raise regex errors directly (matches original behavior)
                 raise
 
+            # Plain literals skip the regex engine and use a substring test per line
+            literal = content_pattern if REGEX_METACHARACTERS.isdisjoint(content_pattern) else None
+
+            # Literals are also looked up in the raw bytes first, through one buffer reused
+            # across files, so files without a hit are never decoded. Line breaks are left
+            # out since text mode translates them and the raw bytes may differ.
+            literal_bytes = None
+            prefilter_buffer = None
+            if literal and '\n' not in literal and '\r' not in literal:
+                literal_bytes = literal.encode('utf-8')
+                prefilter_buffer = bytearray(READ_BUFFER_SIZE)
+
             for file_path in files_to_search:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
+                    if literal_bytes is not None and not self._file_may_contain(file_path, literal_bytes, prefilter_buffer):
+                        continue
+
+                    with open(file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
                         file_matches = []
                         file_total_lines = 0
-                        for line_num, line in enumerate(f, 1):
+                        lines = f.readlines() if os.fstat(f.fileno()).st_size < SMALL_FILE_SIZE else f
+                        for line_num, line in enumerate(lines, 1):
                             file_total_lines = line_num
-                            if pattern.search(line):
+                            if (literal in line) if literal is not None else pattern.search(line):
                                 file_matches.append(LineMeta(
                                     line=line_num,
                                     text=line.strip(),
@@ -470,6 +529,34 @@ class SearchTool(BaseTool):
                 )
             ).dump(**dumping_kwargs)
 
+    def _file_may_contain(self, file_path: str, needle: bytes, buffer: bytearray) -> bool:
+        """
+        Cheaply check whether a file's raw bytes may contain the given needle.
+
+        Args:
+            file_path: The file to check
+            needle: The UTF-8 encoded literal to look for
+            buffer: Reusable read buffer; files larger than it are not checked
+
+        Returns:
+            bool: False if the file certainly does not contain the needle,
+                True if it does or the file is too large to check.
+
+        Raises:
+            UnicodeDecodeError: If a file ruled out is not valid UTF-8, so that
+                it is reported just as reading it as text would.
+        """
+        with open(file_path, 'rb', buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > len(buffer):
+                return True
+            size = f.readinto(buffer)
+        if buffer.find(needle, 0, size) >= 0:
+            return True
+        # Only files with non-ASCII bytes need decoding to be validated
+        if NON_ASCII_BYTE.search(buffer, 0, size):
+            str(memoryview(buffer)[:size], 'utf-8')
+        return False
+
     def _is_within_workspace(self, path: str, workspace_root: str) -> bool:
         """
         Determine whether the given path is inside the workspace directory.
@@ -482,16 +569,11 @@ class SearchTool(BaseTool):
             bool: True if path is inside the workspace root, False otherwise.
         """
         # Resolve both paths to their absolute canonical form
-        path = Path(path).resolve()
-        workspace_root = Path(workspace_root).resolve()
+        path = os.path.realpath(path)
+        workspace_root = os.path.realpath(workspace_root)
 
-        try:
-            # If no exception, path is within the workspace
-            path.relative_to(workspace_root)
-            return True
-        except ValueError:
-            # If ValueError is raised, path is outside workspace_root
-            return False
+        # Compare as strings on a separator boundary, so '/ws-other' is not inside '/ws'
+        return path == workspace_root or path.startswith(workspace_root.rstrip(os.sep) + os.sep)
 
     def _format_results_to_pretty_str(
         self,
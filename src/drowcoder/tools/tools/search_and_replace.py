@@ -10,15 +10,59 @@ This module provides file content search and replace functionality with:
 - Case sensitivity control
 - Unified tool interface with BaseTool
 """
-from dataclasses import dataclass, field
+import atexit
+import errno
+import fnmatch
+import logging
+import mmap
+import multiprocessing
+import operator
+import os
+import posixpath
+import re
+import shutil
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, replace
+from functools import lru_cache
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from .base import BaseTool, ToolResponse, ToolResponseMetadata, ToolResponseType, _IntactType
 
 
 TOOL_NAME = 'search_and_replace'
 
+# Files above this size are streamed line by line for single-line searches
+# instead of being read whole (and probed through a memory map)
+STREAMING_THRESHOLD = 16 << 20
+# Single-line searches jump between occurrences of the search text while at most
+# one line in this many contains one (judged after a sample of occurrences),
+# and check every line otherwise
+SPARSE_HIT_RATIO = 8
+SPARSE_HIT_SAMPLE = 32
+# Decoded file contents kept for repeated searches (e.g. preview then apply):
+# at most this many files, this many bytes in total, and none larger than
+# FILE_CACHE_MAX_FILE_BYTES, so the cache stays small in a long-running process
+FILE_CACHE_SIZE = 256
+FILE_CACHE_MAX_BYTES = 64 << 20
+FILE_CACHE_MAX_FILE_BYTES = 4 << 20
+# A NUL byte within this many leading bytes marks a file as binary
+BINARY_SNIFF_SIZE = 8192
+# Streamed rewrites are encoded and written in pieces of about this many characters
+WRITE_BATCH_SIZE = 1 << 20
+# Directories not descended into when searching a directory: version control
+# metadata and dependency/bytecode caches, which an edit should never touch
+IGNORED_DIRECTORIES = frozenset({'.git', '.hg', '.svn', '__pycache__', 'node_modules', '.venv'})
+# Multi-file searches over at least this many bytes are spread over processes;
+# smaller ones finish before a process pool would have started
+PROCESS_POOL_MIN_BYTES = 64 << 20
+
 @dataclass(frozen=True)
 class OutputStyle:
     """Output formatting styles"""
@@ -34,12 +78,23 @@ class ExecutionMode:
     APPLY   :str = "apply"
 
 
-@dataclass
+@dataclass(slots=True)
 class LineMatch:
     """Represents a line that matches the search pattern"""
     line_number: int
     original_line: str
+    # Shared by every match of a search (the config's list); treat as read-only
     replacement_lines: List[str]
+    lines_consumed: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary asdict() gives, without its generic recursion"""
+        return {
+            'line_number': self.line_number,
+            'original_line': self.original_line,
+            'replacement_lines': list(self.replacement_lines),
+            'lines_consumed': self.lines_consumed,
+        }
 
 
 @dataclass
@@ -48,6 +103,13 @@ class FileResponse:
     file_path: Path
     matches: List[LineMatch] = field(default_factory=list)
 
+    # Content read while searching, kept only for files with matches and reused by
+    # OutputFormatter instead of reading the file again. Left out of to_dict().
+    cached_content: Optional[str] = field(default=None, repr=False, compare=False)
+    # Stat signature (inode, size, mtime, ctime) of the file when it was searched,
+    # used by apply to detect files that changed in between. Left out of to_dict().
+    scanned_signature: Optional[Tuple[int, int, int, int]] = field(default=None, repr=False, compare=False)
+
     @property
     def has_matches(self) -> bool:
         return len(self.matches) > 0
@@ -56,6 +118,13 @@ class FileResponse:
     def total_matches(self) -> int:
         return len(self.matches)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a dictionary of the path and matches, without the scan bookkeeping"""
+        return {
+            'file_path': self.file_path,
+            'matches': [match.to_dict() for match in self.matches],
+        }
+
 
 @dataclass
 class SearchAndReplaceConfig:
@@ -104,130 +173,626 @@ class SearchAndReplaceToolResponse(ToolResponse):
     def total_matches(self) -> int:
         return sum(fr.total_matches for fr in self.file_responses)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary, building the per-match dictionaries directly"""
+        # asdict() recurses generically into every field of every match, which
+        # dominates dumping a large sweep
+        _dict = asdict(replace(self, file_responses=[]))
+        _dict['file_responses'] = [file_response.to_dict() for file_response in self.file_responses]
+        return _dict
+
+
+@dataclass(frozen=True)
+class SearchPattern:
+    """Preprocessed search pattern shared by every LineSearcher with the same search"""
+    search_lines: Tuple[str, ...]
+    bad_line_shifts: Dict[str, int]
+    probe: str
+    probe_offsets: Tuple[int, ...]
+
+
+@lru_cache(maxsize=128)
+def _compile_search_pattern(search: str, case_sensitive: bool) -> SearchPattern:
+    """Normalize the search lines and build the multi-line skip table, once per pattern"""
+    search_lines = tuple(
+        line.strip() if case_sensitive else line.strip().casefold()
+        for line in search.split('\n')
+    )
+
+    # Boyer-Moore-Horspool bad-line table: distance from the last occurrence of each
+    # line (tail excluded) to the end of the pattern
+    tail_offset = len(search_lines) - 1
+    bad_line_shifts = {line: tail_offset - k for k, line in enumerate(search_lines[:-1])}
+
+    # Every match contains each normalized search line verbatim; the longest one is
+    # the most selective to look for in a whole file
+    probe = max(search_lines, key=len)
+    probe_offsets = tuple(k for k, line in enumerate(search_lines) if line == probe)
+
+    return SearchPattern(
+        search_lines=search_lines,
+        bad_line_shifts=bad_line_shifts,
+        probe=probe,
+        probe_offsets=probe_offsets,
+    )
+
+
+def _is_binary_file(path: Union[str, Path]) -> bool:
+    """Check whether a file looks binary from its leading bytes"""
+    with open(path, 'rb') as f:
+        return b'\0' in f.read(BINARY_SNIFF_SIZE)
+
+
+def _read_text_file(path: Union[str, Path], size: int) -> Optional[str]:
+    """
+    Read a file's text, or return None if the file is binary or not valid UTF-8.
+
+    The file is read unbuffered straight into a buffer of its stat size, leading
+    bytes first, so binary files are rejected without reading the rest and text
+    is decoded from the buffer without further copies.
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    with open(path, 'rb', buffering=0) as f:
+        filled = f.readinto(view[:BINARY_SNIFF_SIZE])
+        if buffer.find(b'\0', 0, filled) != -1:
+            return None
+        while filled < size:
+            count = f.readinto(view[filled:])
+            if not count:
+                break
+            filled += count
+        # The file may have grown since it was stat'ed
+        rest = f.read()
+        if rest and filled < BINARY_SNIFF_SIZE and b'\0' in rest[:BINARY_SNIFF_SIZE - filled]:
+            return None
+
+    try:
+        if rest:
+            text = (bytes(view[:filled]) + rest).decode('utf-8')
+        else:
+            text = str(view[:filled], 'utf-8')
+    except UnicodeDecodeError:
+        return None
+
+    # Translate line breaks the way text mode would
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+@lru_cache(maxsize=64)
+def _compile_file_pattern(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """Compile a file name glob once; the returned matcher takes os.path.normcase'd names"""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def _join_lines_in_batches(lines: Iterable[str], batch_size: int = WRITE_BATCH_SIZE) -> Iterator[str]:
+    """Join lines with line breaks, yielding the text in pieces of about batch_size characters"""
+    batch = []
+    size = 0
+    separator = ''
+    for line in lines:
+        batch.append(line)
+        size += len(line) + 1
+        if size >= batch_size:
+            yield separator + '\n'.join(batch)
+            batch = []
+            size = 0
+            separator = '\n'
+    if batch or not separator:
+        yield separator + '\n'.join(batch)
+
+
+def _encode_pieces(pieces: Iterable[str]) -> Iterator[bytes]:
+    """Encode text pieces as UTF-8, translating line breaks the way text mode would"""
+    for piece in pieces:
+        if os.linesep != '\n':
+            piece = piece.replace('\n', os.linesep)
+        yield piece.encode('utf-8')
+
+
+def _write_file_atomic(path: Union[str, Path], content: Union[str, Iterable[str]]) -> None:
+    """
+    Write a file's text through a temporary file renamed over it.
+
+    An interrupted write leaves the original file intact rather than truncated.
+    Symlinks are written through to their target, and line breaks are translated
+    the way text mode would. Otherwise this behaves like writing the file in
+    place: a file the caller may not write raises PermissionError, and an
+    existing file keeps its permission bits and, where allowed, its owner.
+    Files with other hard links, or in a directory the caller cannot write to,
+    are rewritten in place, since a rename would split the links or fail; the
+    new text is spooled to a temporary file first, as streamed content may
+    still be reading the original.
+
+    Args:
+        path: File to write
+        content: The text, or its lines (without line breaks) to write as a stream
+    """
+    path = os.path.realpath(path)
+    pieces = [content] if isinstance(content, str) else _join_lines_in_batches(content)
+
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is not None and not os.access(path, os.W_OK):
+        raise PermissionError(errno.EACCES, os.strerror(errno.EACCES), path)
+
+    if (st is not None and st.st_nlink > 1) or not os.access(os.path.dirname(path), os.W_OK):
+        with tempfile.TemporaryFile() as spool:
+            for data in _encode_pieces(pieces):
+                spool.write(data)
+            spool.seek(0)
+            with open(path, 'wb') as f:
+                shutil.copyfileobj(spool, f, WRITE_BATCH_SIZE)
+        return
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        try:
+            for data in _encode_pieces(pieces):
+                data = memoryview(data)
+                while data:
+                    data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        if st is not None:
+            # Only privileged callers can hand the file back to another owner;
+            # chown before chmod, as chown may clear the set-id bits
+            if hasattr(os, 'chown'):
+                try:
+                    os.chown(tmp_path, st.st_uid, st.st_gid)
+                except OSError:
+                    pass
+            os.chmod(tmp_path, stat.S_IMODE(st.st_mode))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _stat_signature(st: os.stat_result) -> Tuple[int, int, int, int]:
+    """Identify a version of a file: its inode, size, and modification and change times"""
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+# Content cache for _read_file, least recently used first; FILE_CACHE_* bound it
+_file_cache: "OrderedDict[Tuple[str, Tuple[int, int, int, int]], Optional[str]]" = OrderedDict()
+_file_cache_bytes = 0
+_file_cache_lock = threading.Lock()
+# Off in process pool workers, whose reads the parent never sees
+_file_cache_enabled = True
+
+
+def _clear_file_cache() -> None:
+    """Drop every cached file content"""
+    global _file_cache_bytes
+    with _file_cache_lock:
+        _file_cache.clear()
+        _file_cache_bytes = 0
+
+
+def _read_file(path: Union[str, Path], st: Optional[os.stat_result] = None) -> Optional[str]:
+    """
+    Read a file's text through the content cache, or return None if it is not text.
+
+    Entries are keyed on the resolved path and the file's stat signature, so a
+    file reached through different paths is cached once and a modified file is
+    read afresh. Undecodable files are cached as None too, so searching them
+    again neither reads them nor raises.
+    """
+    global _file_cache_bytes
+    if st is None:
+        st = os.stat(path)
+    key = (os.path.realpath(path), _stat_signature(st))
+    with _file_cache_lock:
+        if key in _file_cache:
+            _file_cache.move_to_end(key)
+            return _file_cache[key]
+
+    content = _read_text_file(path, st.st_size)
+    if not _file_cache_enabled or st.st_size > FILE_CACHE_MAX_FILE_BYTES:
+        return content
+
+    with _file_cache_lock:
+        if key not in _file_cache:
+            _file_cache[key] = content
+            _file_cache_bytes += st.st_size
+            while len(_file_cache) > FILE_CACHE_SIZE or _file_cache_bytes > FILE_CACHE_MAX_BYTES:
+                (_, (_, evicted_size, _, _)), _ = _file_cache.popitem(last=False)
+                _file_cache_bytes -= evicted_size
+    return content
+
 
 class LineSearcher:
     """Handles line-based exact matching"""
 
     def __init__(self, config: SearchAndReplaceConfig):
         self.config = config
+        # Normalize the search pattern once rather than on every line comparison
+        # (cached across searchers, since the agent often repeats the same search)
+        self.pattern = _compile_search_pattern(config.search, config.case_sensitive)
+        self.search_lines = self.pattern.search_lines
+
+    @property
+    def is_multiline(self) -> bool:
+        """Whether the search pattern spans multiple lines"""
+        return len(self.search_lines) > 1
+
+    def may_match(self, content: str) -> bool:
+        """
+        Cheaply rule out content that cannot contain a match.
+
+        A matching line holds its stripped search line verbatim, so content
+        without the probe line anywhere in it has no matches. This runs as a
+        single C-level substring search instead of a per-line loop.
+        """
+        if not self.pattern.probe:
+            return True
+        haystack = content if self.config.case_sensitive else content.casefold()
+        return self.pattern.probe in haystack
+
+    def may_match_file(self, file_path: Union[str, Path]) -> bool:
+        """
+        Cheaply rule out a file that cannot contain a match, without reading it.
+
+        Like may_match, but the probe is looked up in a read-only memory map of
+        the file's bytes, so nothing is copied into memory or decoded. Only
+        case-sensitive searches are ruled out this way, since casefolding needs
+        the decoded text.
+        """
+        probe = self.pattern.probe
+        if not probe or not self.config.case_sensitive:
+            return True
+        with open(file_path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return False  # Empty files cannot be mapped (and hold no probe)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped.find(probe.encode('utf-8')) != -1
 
     def find_matches(self, content: str) -> List[LineMatch]:
         """Find all matching lines in content"""
-        lines = content.split('\n')
+        line_count = content.count('\n') + 1
+
+        # Whole-content single-line searches need not split the content into lines
+        if (not self.is_multiline and self.search_lines[0]
+                and not self.config.start_line and not self.config.end_line):
+            return self._find_single_line_matches_in_content(content, line_count)
+
         matches = []
 
         # Determine search range
         start_idx = (self.config.start_line - 1) if self.config.start_line else 0
-        end_idx = (self.config.end_line - 1) if self.config.end_line else len(lines) - 1
+        end_idx = (self.config.end_line - 1) if self.config.end_line else line_count - 1
         start_idx = max(0, start_idx)
-        end_idx = min(len(lines) - 1, end_idx)
+        end_idx = min(line_count - 1, end_idx)
 
-        # Check if search pattern is multi-line
-        search_lines = self.config.search.split('\n')
-        is_multiline_search = len(search_lines) > 1
+        # Lines past the end of the range are never looked at, so stop splitting there
+        # (the rest of the content is left as a single trailing element)
+        lines = content.split('\n', end_idx + 1)
 
-        if is_multiline_search:
-            matches = self._find_multiline_matches(lines, search_lines, start_idx, end_idx)
+        # Check if search pattern is multi-line
+        if self.is_multiline:
+            probe = self.pattern.probe
+            haystack = content if self.config.case_sensitive else content.casefold()
+            if probe and haystack.count(probe) * SPARSE_HIT_RATIO <= line_count:
+                matches = self._find_multiline_matches_by_probe(lines, haystack, start_idx, end_idx)
+            else:
+                matches = self._find_multiline_matches(lines, self.search_lines, start_idx, end_idx)
         else:
             matches = self._find_single_line_matches(lines, start_idx, end_idx)
 
         return matches
 
-    def _find_single_line_matches(self, lines: List[str], start_idx: int, end_idx: int) -> List[LineMatch]:
-        """Find single line matches"""
+    def find_matches_in_file(self, file_path: Union[str, Path]) -> List[LineMatch]:
+        """
+        Find single-line matches by streaming a file rather than reading it whole.
+
+        Lines are read and discarded one at a time, so a large file without
+        matches is never held in memory. Multi-line searches need look-ahead
+        and go through find_matches instead.
+        """
+        start_idx = (self.config.start_line - 1) if self.config.start_line else 0
+        end_idx = (self.config.end_line - 1) if self.config.end_line else None
+        start_idx = max(0, start_idx)
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return self._find_single_line_matches(self._iter_lines(f), start_idx, end_idx)
+
+    @staticmethod
+    def _iter_lines(f: Iterable[str]) -> Iterator[str]:
+        """Yield lines without line breaks, the same lines content.split('\\n') gives"""
+        line = ''
+        for line in f:
+            yield line[:-1] if line.endswith('\n') else line
+        # A trailing line break (or an empty file) leaves one last empty line
+        if not line or line.endswith('\n'):
+            yield ''
+
+    def _find_single_line_matches(self, lines: Iterable[str], start_idx: int, end_idx: Optional[int]) -> List[LineMatch]:
+        """Find single line matches (through the last line if end_idx is None)"""
+        # Hoist attribute lookups and the per-line method call out of the loop
+        search = self.search_lines[0]
+        replace = self.config.replace
+
+        stop = None if end_idx is None else max(start_idx, end_idx + 1)
+        numbered = enumerate(islice(lines, start_idx, stop), start_idx + 1)
+        if self.config.case_sensitive:
+            return [
+                LineMatch(line_number=line_number, original_line=line, replacement_lines=replace)
+                for line_number, line in numbered
+                if line.strip() == search
+            ]
+        return [
+            LineMatch(line_number=line_number, original_line=line, replacement_lines=replace)
+            for line_number, line in numbered
+            if line.strip().casefold() == search
+        ]
+
+    def _find_single_line_matches_in_content(self, content: str, line_count: int) -> List[LineMatch]:
+        """
+        Find single-line matches over the whole content without splitting it into lines.
+
+        A matching line contains the (non-empty) search line verbatim, so the search
+        jumps between its occurrences with str.find and only the lines holding one
+        are stripped and compared. Lines without an occurrence cost no Python code.
+
+        Once occurrences turn out to be dense, the rest of the content is checked
+        line by line instead, which is cheaper per line than jumping per occurrence.
+
+        Args:
+            content: Content to search
+            line_count: Number of lines in content
+        """
         matches = []
-        for i in range(start_idx, end_idx + 1):
-            line = lines[i]
-            if self._line_matches(line, self.config.search):
-                match = LineMatch(
-                    line_number=i + 1,
-                    original_line=line,
-                    replacement_lines=self.config.replace.copy()
-                )
-                matches.append(match)
+        search = self.search_lines[0]
+        replace = self.config.replace
+
+        haystack = content if self.config.case_sensitive else content.casefold()
+        # casefold maps each character to one or more characters, so equal lengths
+        # mean offsets into haystack are offsets into content
+        lines = None if len(haystack) == len(content) else content.split('\n')
+
+        # line_idx is the index of the line starting at haystack position `counted`
+        line_idx = 0
+        counted = 0
+        haystack_len = len(haystack)
+        # Occurrences closer together than this many characters on average are dense
+        sparse_gap = haystack_len * SPARSE_HIT_RATIO // line_count
+        candidates = 0
+        pos = haystack.find(search)
+        while pos != -1:
+            line_start = haystack.rfind('\n', 0, pos) + 1
+
+            candidates += 1
+            if candidates > SPARSE_HIT_SAMPLE and pos < candidates * sparse_gap:
+                # Occurrences are too dense for jumping to pay off
+                line_idx += haystack.count('\n', counted, line_start)
+                if lines is None:
+                    lines = content.split('\n')
+                matches.extend(self._find_single_line_matches(lines, line_idx, None))
+                break
+
+            line_end = haystack.find('\n', pos + len(search))
+            if line_end == -1:
+                line_end = haystack_len
+
+            if haystack[line_start:line_end].strip() == search:
+                line_idx += haystack.count('\n', counted, line_start)
+                counted = line_start
+                matches.append(LineMatch(
+                    line_number=line_idx + 1,
+                    original_line=content[line_start:line_end] if lines is None else lines[line_idx],
+                    replacement_lines=replace
+                ))
+
+            # A line matches at most once; continue with the next line
+            pos = haystack.find(search, line_end + 1)
+
         return matches
 
-    def _find_multiline_matches(self, lines: List[str], search_lines: List[str], start_idx: int, end_idx: int) -> List[LineMatch]:
+    def _find_multiline_matches_by_probe(self, lines: List[str], haystack: str, start_idx: int, end_idx: int) -> List[LineMatch]:
+        """
+        Find multi-line matches by jumping between occurrences of the probe line.
+
+        Every match contains its normalized probe line verbatim, so occurrences of
+        the probe are located with str.find and only the windows that would put the
+        probe on that line are verified. Matching windows are then taken left to
+        right without overlap, as the sliding search would.
+
+        Args:
+            lines: Content lines (through end_idx)
+            haystack: The content, casefolded if the search is case-insensitive
+            start_idx: First line index of the search range
+            end_idx: Last line index of the search range
+        """
+        search_lines = self.search_lines
+        search_line_count = len(search_lines)
+        probe = self.pattern.probe
+        probe_offsets = self.pattern.probe_offsets
+        normalize = str.strip if self.config.case_sensitive else (lambda line: line.strip().casefold())
+        last_start = end_idx - search_line_count + 1
+
+        # line_idx is the index of the line containing haystack position `counted`
+        line_idx = 0
+        counted = 0
+        checked = set()
+        starts = []
+        pos = haystack.find(probe)
+        while pos != -1:
+            line_idx += haystack.count('\n', counted, pos)
+            counted = pos
+            if line_idx > end_idx:
+                break
+
+            for offset in probe_offsets:
+                start = line_idx - offset
+                if start < start_idx or start > last_start or start in checked:
+                    continue
+                checked.add(start)
+                if all(map(operator.eq, map(normalize, lines[start:start + search_line_count]), search_lines)):
+                    starts.append(start)
+
+            # Continue with the next line
+            next_line = haystack.find('\n', pos)
+            if next_line == -1:
+                break
+            line_idx += 1
+            counted = next_line + 1
+            pos = haystack.find(probe, counted)
+
+        matches = []
+        next_free = start_idx
+        replace = self.config.replace
+        for start in sorted(starts):
+            if start < next_free:
+                continue
+            matches.append(LineMatch(
+                line_number=start + 1,
+                original_line='\n'.join(lines[start:start + search_line_count]),
+                replacement_lines=replace,
+                lines_consumed=search_line_count,
+            ))
+            next_free = start + search_line_count
+
+        return matches
+
+    def _find_multiline_matches(self, lines: List[str], search_lines: Tuple[str, ...], start_idx: int, end_idx: int) -> List[LineMatch]:
         """Find multi-line matches"""
         matches = []
         search_line_count = len(search_lines)
+        tail_offset = search_line_count - 1
+        # Pick the normalization once; str.strip is a C function, so case-sensitive
+        # verification runs without any Python-level call per line
+        normalize = str.strip if self.config.case_sensitive else (lambda line: line.strip().casefold())
+        search_head = search_lines[:tail_offset]
+
+        # Boyer-Moore-Horspool at line granularity: each window is judged by its last
+        # line first, and on a miss the window jumps by that line's distance to the
+        # end of the pattern (its last occurrence before the tail), or the full
+        # pattern length if it does not occur. Lines that are jumped over are never
+        # normalized. Keys are normalized lines, whose hashes str caches.
+        bad_line_shifts = self.pattern.bad_line_shifts
+        search_tail = search_lines[-1]
 
         # Slide through the lines looking for multi-line matches
         i = start_idx
-        while i <= end_idx - search_line_count + 1:
-            # Check if the next N lines match the search pattern
-            candidate_lines = lines[i:i + search_line_count]
-            if len(candidate_lines) == search_line_count and self._multiline_matches(candidate_lines, search_lines):
+        while i <= end_idx - tail_offset:
+            tail = normalize(lines[i + tail_offset])
+            if tail == search_tail and all(
+                map(operator.eq, map(normalize, lines[i:i + tail_offset]), search_head)
+            ):
                 # Create a match that represents multiple lines
-                original_content = '\n'.join(candidate_lines)
+                original_content = '\n'.join(lines[i:i + search_line_count])
                 match = LineMatch(
                     line_number=i + 1,  # Start line number
                     original_line=original_content,  # Store all matched lines
-                    replacement_lines=self.config.replace.copy()
+                    replacement_lines=self.config.replace,
+                    lines_consumed=search_line_count,
                 )
                 matches.append(match)
 
                 # Skip the matched lines to avoid overlapping matches
                 i += search_line_count
             else:
-                i += 1
+                i += bad_line_shifts.get(tail, search_line_count)
 
         return matches
 
-    def _multiline_matches(self, candidate_lines: List[str], search_lines: List[str]) -> bool:
-        """Check if multiple lines match the search pattern"""
-        if len(candidate_lines) != len(search_lines):
-            return False
-
-        for candidate_line, search_line in zip(candidate_lines, search_lines):
-            if not self._line_matches(candidate_line, search_line):
-                return False
-        return True
-
-    def _line_matches(self, line: str, search: str) -> bool:
-        """Check if a line matches the search pattern"""
-        # For exact line matching, we compare the stripped versions
-        line_to_check = line.strip()
-        search_to_check = search.strip()
-
-        if not self.config.case_sensitive:
-            return search_to_check.lower() == line_to_check.lower()
-        return search_to_check == line_to_check
-
 
 class OutputFormatter:
     """Handles different output formatting styles"""
 
     @staticmethod
-    def format_default(file_response: FileResponse) -> str:
-        """Generate complete modified file content"""
-        if not file_response.has_matches:
-            # Return original content if no matches
-            try:
-                with open(file_response.file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except:
-                return ""
-
-        # Read original content and apply replacements
+    def _read_content(file_response: FileResponse) -> Optional[str]:
+        """Get original file content, preferring the copy cached during the search"""
+        if file_response.cached_content is not None:
+            return file_response.cached_content
         try:
-            with open(file_response.file_path, 'r', encoding='utf-8') as f:
-                lines = f.read().split('\n')
+            return _read_file(file_response.file_path)
         except:
-            return ""
+            return None
+
+    @staticmethod
+    def _rebuild_lines(
+        lines: List[str],
+        matches: List[LineMatch],
+        build_block: Callable[[LineMatch], List[str]],
+    ) -> List[str]:
+        """
+        Rebuild lines in a single pass, substituting a block for each match.
+
+        Untouched runs of lines are copied between matches, so the cost is linear
+        in the file size rather than one list splice per match.
 
-        # Apply replacements from bottom to top to maintain line numbers
-        for match in reversed(file_response.matches):
+        Args:
+            lines: Original file lines
+            matches: Matches to substitute (non-overlapping)
+            build_block: Called with each match, returns the lines to emit in its place
+
+        Returns:
+            List[str]: The rebuilt lines
+        """
+        output = []
+        cursor = 0
+        for match in sorted(matches, key=lambda match: match.line_number):
             line_idx = match.line_number - 1
+            if not 0 <= line_idx < len(lines):
+                continue
 
-            # Check if this is a multi-line match
-            original_lines = match.original_line.split('\n')
-            lines_to_replace = len(original_lines)
+            output.extend(lines[cursor:line_idx])
+            output.extend(build_block(match))
+            cursor = line_idx + match.lines_consumed
 
-            if 0 <= line_idx < len(lines):
-                # Replace the matched lines with replacement lines
-                lines[line_idx:line_idx + lines_to_replace] = match.replacement_lines
+        output.extend(lines[cursor:])
+        return output
 
+    @staticmethod
+    def iter_default_lines(file_response: FileResponse) -> Iterator[str]:
+        """
+        Yield the lines of the modified file content, reading the original as a stream.
+
+        Gives the lines of format_default's result without holding the file in
+        memory. The file is opened when iteration starts.
+        """
+        pending = iter(sorted(file_response.matches, key=lambda match: match.line_number))
+        match = next(pending, None)
+        skip = 0
+
+        with open(file_response.file_path, 'r', encoding='utf-8') as f:
+            for line_idx, line in enumerate(LineSearcher._iter_lines(f)):
+                if skip:
+                    skip -= 1
+                elif match is not None and line_idx == match.line_number - 1:
+                    yield from match.replacement_lines
+                    skip = match.lines_consumed - 1
+                    match = next(pending, None)
+                else:
+                    yield line
+
+    @staticmethod
+    def format_default(file_response: FileResponse) -> str:
+        """Generate complete modified file content"""
+        content = OutputFormatter._read_content(file_response)
+        if content is None:
+            return ""
+
+        if not file_response.has_matches:
+            # Return original content if no matches
+            return content
+
+        # Apply replacements to original content, replacing the matched lines with replacement lines
+        lines = OutputFormatter._rebuild_lines(
+            content.split('\n'),
+            file_response.matches,
+            lambda match: match.replacement_lines,
+        )
         return '\n'.join(lines)
 
     @staticmethod
@@ -236,18 +801,18 @@ class OutputFormatter:
         if not file_response.has_matches:
             return ""
 
-        output = []
-        output.append(f"diff --git a/{file_response.file_path} b/{file_response.file_path}")
-        output.append("index 0000000..0000000 100644")
-        output.append(f"--- a/{file_response.file_path}")
-        output.append(f"+++ b/{file_response.file_path}")
+        file_path = file_response.file_path
+        output = [
+            f"diff --git a/{file_path} b/{file_path}\n"
+            f"index 0000000..0000000 100644\n"
+            f"--- a/{file_path}\n"
+            f"+++ b/{file_path}"
+        ]
 
         for match in file_response.matches:
             line_num = match.line_number
-            output.append(f"@@ -{line_num},1 +{line_num},{len(match.replacement_lines)} @@")
-            output.append(f"-{match.original_line}")
-            for replacement_line in match.replacement_lines:
-                output.append(f"+{replacement_line}")
+            output.append(f"@@ -{line_num},1 +{line_num},{len(match.replacement_lines)} @@\n-{match.original_line}")
+            output.extend(f"+{replacement_line}" for replacement_line in match.replacement_lines)
 
         return '\n'.join(output)
 
@@ -257,25 +822,124 @@ class OutputFormatter:
         if not file_response.has_matches:
             return OutputFormatter.format_default(file_response)
 
-        try:
-            with open(file_response.file_path, 'r', encoding='utf-8') as f:
-                lines = f.read().split('\n')
-        except:
+        content = OutputFormatter._read_content(file_response)
+        if content is None:
             return ""
+        # Apply conflict markers around each match; only multi-line matches need
+        # their original text split back into lines
+        lines = OutputFormatter._rebuild_lines(
+            content.split('\n'),
+            file_response.matches,
+            lambda match: [
+                "<<<<<<< HEAD",
+                *(match.original_line.split('\n') if match.lines_consumed > 1 else (match.original_line,)),
+                "=======",
+                *match.replacement_lines,
+                ">>>>>>> incoming",
+            ],
+        )
+        return '\n'.join(lines)
 
-        # Apply conflict markers from bottom to top
-        for match in reversed(file_response.matches):
-            line_idx = match.line_number - 1
 
-            # Check if this is a multi-line match
-            original_lines = match.original_line.split('\n')
-            lines_to_replace = len(original_lines)
+def _scan_file(file_path: Path, searcher: LineSearcher) -> Optional[FileResponse]:
+    """
+    Read a file and find its matches, or return None if the file is not text.
+
+    Raises OSError if the file cannot be read.
+    """
+    st = os.stat(file_path)
+    if not searcher.is_multiline and st.st_size > STREAMING_THRESHOLD:
+        if _is_binary_file(file_path):
+            return None
+        # Large files are streamed for single-line searches; the formatters
+        # read them again only if they turn out to have matches
+        matches = searcher.find_matches_in_file(file_path) if searcher.may_match_file(file_path) else []
+        return FileResponse(file_path=file_path, matches=matches, scanned_signature=_stat_signature(st))
+
+    # Repeated searches over unchanged files (e.g. preview then apply) hit the cache
+    content = _read_file(file_path, st)
+    if content is None:
+        return None
+
+    # Skip the line-by-line scan when the search text appears nowhere in the file
+    matches = searcher.find_matches(content) if searcher.may_match(content) else []
+    return FileResponse(
+        file_path=file_path,
+        matches=matches,
+        cached_content=content if matches else None,
+        scanned_signature=_stat_signature(st),
+    )
+
+
+def _scan_file_in_worker(file_path: Path, config: SearchAndReplaceConfig) -> Tuple[Optional[FileResponse], Optional[str]]:
+    """Process pool entry point for _scan_file, returning any error as a message"""
+    try:
+        file_response = _scan_file(file_path, LineSearcher(config))
+    except Exception as e:
+        return None, f"Error processing {file_path}: {e}"
+
+    # Sending the content back costs about as much as reading it again if needed
+    if file_response is not None:
+        file_response.cached_content = None
+    return file_response, None
+
+
+def _exceeds_total_size(files: List[Path], limit: int) -> bool:
+    """Check whether the files add up to at least limit bytes, stopping once they do"""
+    total = 0
+    for file_path in files:
+        try:
+            total += os.path.getsize(file_path)
+        except OSError:
+            continue
+        if total >= limit:
+            return True
+    return False
+
+
+# Process pool for large scans, shared by every tool and created on first use.
+# Its workers come from forkserver (or spawn where that is unavailable), as
+# forking a process that has other threads running can deadlock.
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _process_pool = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_process_pool_worker,
+            )
+        return _process_pool
+
 
-            if 0 <= line_idx < len(lines):
-                conflict_block = ["<<<<<<< HEAD"] + original_lines + ["======="] + match.replacement_lines + [">>>>>>> incoming"]
-                lines[line_idx:line_idx + lines_to_replace] = conflict_block
+def _init_process_pool_worker() -> None:
+    """Set up a process pool worker: it reads each file once, so it keeps no content cache"""
+    global _file_cache_enabled
+    _file_cache_enabled = False
 
-        return '\n'.join(lines)
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so that the next scan starts a fresh one"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_process_pool() -> None:
+    """Shut down the shared process pool, if one was started"""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
 
 
 class SearchAndReplaceTool(BaseTool):
@@ -357,19 +1021,7 @@ class SearchAndReplaceTool(BaseTool):
             files_to_process = self._find_files(target_path, config.file_pattern)
 
             # Process each file
-            file_responses = []
-            searcher = LineSearcher(config)
-            for file_path in files_to_process:
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    matches = searcher.find_matches(content)
-                    file_response = FileResponse(file_path=file_path, matches=matches)
-                    file_responses.append(file_response)
-
-                except Exception as e:
-                    self.logger.warning(f"Error processing {file_path}: {e}")
+            file_responses = self._scan_files(files_to_process, config)
 
             response = SearchAndReplaceToolResponse(
                 success=True,
@@ -412,6 +1064,106 @@ class SearchAndReplaceTool(BaseTool):
                 error=error_msg
             ).dump(**dumping_kwargs)
 
+    def apply_response(
+        self,
+        response: SearchAndReplaceToolResponse,
+        output_style: str = OutputStyle.DEFAULT,
+        output_file: Optional[Union[str, Path]] = None,
+        as_type: Union[str, _IntactType] = ToolResponseType.PRETTY_STR,
+        filter_empty_fields: bool = True,
+        filter_metadata_fields: bool = True,
+    ) -> Any:
+        """
+        Apply the matches of an earlier response (e.g. a preview) without searching again.
+
+        Files modified since that response was produced are not written and are
+        reported as errors.
+
+        Args:
+            response: SearchAndReplaceToolResponse returned by execute with as_type=INTACT
+            output_style: "default", "git_diff", or "git_conflict"
+            output_file: Optional output file path
+            as_type: Output format type for the response
+            filter_empty_fields: Whether to filter empty fields in output
+            filter_metadata_fields: Whether to filter metadata fields in output
+
+        Returns:
+            SearchAndReplaceToolResponse (or converted format based on as_type)
+        """
+        self._validate_initialized()
+
+        local_vars = locals().copy()
+        dumping_kwargs = self._parse_dump_kwargs(local_vars)
+
+        try:
+            applied = SearchAndReplaceToolResponse(
+                success=True,
+                file_responses=response.file_responses,
+                metadata=response.metadata
+            )
+            style_str = output_style.lower() if isinstance(output_style, str) else output_style
+            self._handle_apply(applied, style_str, output_file)
+            return applied.dump(**dumping_kwargs)
+
+        except Exception as e:
+            error_msg = f"Search and replace failed: {str(e)}"
+            self.logger.error(error_msg)
+
+            return SearchAndReplaceToolResponse(
+                success=False,
+                error=error_msg
+            ).dump(**dumping_kwargs)
+
+    def _scan_files(self, files: List[Path], config: SearchAndReplaceConfig) -> List[FileResponse]:
+        """Scan files for matches, in parallel when there are several"""
+        scanned = None
+        if (len(files) > 1 and (os.cpu_count() or 1) > 1
+                and _exceeds_total_size(files, PROCESS_POOL_MIN_BYTES)):
+            # Matching holds the GIL, so large sweeps use a process per core
+            scanned = self._scan_files_in_processes(files, config)
+
+        if scanned is None:
+            # Reads release the GIL, so a thread pool overlaps them (map keeps file order)
+            searcher = LineSearcher(config)
+            if len(files) > 1:
+                with ThreadPoolExecutor() as executor:
+                    scanned = list(executor.map(lambda file_path: self._scan_file(file_path, searcher), files))
+            else:
+                scanned = [self._scan_file(file_path, searcher) for file_path in files]
+
+        return [file_response for file_response in scanned if file_response is not None]
+
+    def _scan_files_in_processes(self, files: List[Path], config: SearchAndReplaceConfig) -> Optional[List[Optional[FileResponse]]]:
+        """Scan files in the shared process pool, or return None if the pool broke"""
+        pool = _get_process_pool()
+        try:
+            results = list(pool.map(_scan_file_in_worker, files, repeat(config), chunksize=16))
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Process pool failed, scanning in threads instead: {e}")
+            _discard_process_pool(pool)
+            return None
+
+        scanned = []
+        for file_path, (file_response, error) in zip(files, results):
+            if error is not None:
+                self.logger.warning(error)
+            elif file_response is None:
+                self.logger.debug(f"Skipping binary or non-UTF-8 file: {file_path}")
+            scanned.append(file_response)
+        return scanned
+
+    def _scan_file(self, file_path: Path, searcher: LineSearcher) -> Optional[FileResponse]:
+        """Read a file and find its matches, or return None if it cannot be processed"""
+        try:
+            file_response = _scan_file(file_path, searcher)
+        except Exception as e:
+            self.logger.warning(f"Error processing {file_path}: {e}")
+            return None
+
+        if file_response is None:
+            self.logger.debug(f"Skipping binary or non-UTF-8 file: {file_path}")
+        return file_response
+
     def _is_search_replace_identical(self, search: str, replace: Union[str, List[str]]) -> bool:
         """Check if search and replace patterns are identical"""
         # Normalize replace to string
@@ -429,19 +1181,67 @@ class SearchAndReplaceTool(BaseTool):
             return [target_path]
 
         if target_path.is_dir():
-            return list(target_path.rglob(pattern))
+            if os.sep in pattern or (os.altsep and os.altsep in pattern) or '**' in pattern:
+                # Patterns spanning directories still need pathlib's glob
+                files = [
+                    file_path for file_path in target_path.rglob(pattern)
+                    if IGNORED_DIRECTORIES.isdisjoint(file_path.relative_to(target_path).parts[:-1])
+                ]
+            else:
+                files = list(self._walk_files(str(target_path), _compile_file_pattern(pattern)))
+            # Read files of the same directory back to back, in a stable order
+            # regardless of how the filesystem lists them
+            files.sort(key=lambda p: (p.parent.as_posix(), p.name))
+            return files
 
         raise FileNotFoundError(f"Path not found: {target_path}")
 
+    def _walk_files(self, directory: str, match: Callable[[str], Optional[re.Match]]) -> Iterator[Path]:
+        """
+        Yield files under a directory whose names are accepted by the matcher.
+
+        Uses os.scandir, whose entries carry their file type from the directory
+        listing, instead of building a Path for every entry as Path.rglob does.
+        Files are yielded in the same order as rglob, and symlinked directories
+        and IGNORED_DIRECTORIES are not descended into.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        # normcase is a no-op on POSIX, so skip the call there (as fnmatch.filter does)
+        normcase = None if os.path is posixpath else os.path.normcase
+
+        subdirectories = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRECTORIES:
+                        subdirectories.append(entry.path)
+                elif match(entry.name if normcase is None else normcase(entry.name)) and entry.is_file():
+                    yield Path(entry.path)
+            except OSError:
+                continue
+
+        for subdirectory in subdirectories:
+            yield from self._walk_files(subdirectory, match)
+
     def _handle_preview(self, response: SearchAndReplaceToolResponse, style: str):
         """Handle preview mode output"""
         file_count = 0
+        # The formatted preview only goes to the log; skip formatting when INFO is off
+        log_preview = self.logger.isEnabledFor(logging.INFO)
 
         for file_response in response.file_responses:
             if not file_response.has_matches:
                 continue
 
             file_count += 1
+            if not log_preview:
+                continue
+
             self.logger.info("=" * 60)
             self.logger.info(f"File: {file_response.file_path}")
             self.logger.info(f"Matches: {file_response.total_matches}")
@@ -479,9 +1279,25 @@ class SearchAndReplaceTool(BaseTool):
             else:
                 target_path = file_response.file_path
 
+            # Matches found in a file that has since changed no longer line up with it
+            if file_response.scanned_signature is not None:
+                try:
+                    changed = _stat_signature(os.stat(file_response.file_path)) != file_response.scanned_signature
+                except OSError:
+                    changed = True
+                if changed:
+                    error_msg = f"File changed since it was searched: {file_response.file_path}"
+                    errors.append(error_msg)
+                    self.logger.error(error_msg)
+                    continue
+
             # Generate content based on style
             if style == OutputStyle.DEFAULT:
-                content = self.formatter.format_default(file_response)
+                if file_response.cached_content is None:
+                    # Files streamed during the search are rewritten as a stream too
+                    content = self.formatter.iter_default_lines(file_response)
+                else:
+                    content = self.formatter.format_default(file_response)
             elif style == OutputStyle.GIT_DIFF:
                 content = self.formatter.format_git_diff(file_response)
                 # For git diff, save to .diff file
@@ -491,8 +1307,7 @@ class SearchAndReplaceTool(BaseTool):
 
             # Write to file
             try:
-                with open(target_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                _write_file_atomic(target_path, content)
                 files_written.append(str(target_path))
                 self.logger.info(f"Applied changes to: {target_path}")
             except Exception as e:
@@ -500,6 +1315,11 @@ class SearchAndReplaceTool(BaseTool):
                 errors.append(error_msg)
                 self.logger.error(error_msg)
 
+        # mtime granularity is filesystem dependent, so do not rely on it to
+        # invalidate content we have just rewritten ourselves
+        if files_written:
+            _clear_file_cache()
+
         # Set response status once at the end
         if errors:
             response.success = False
@@ -2,5 +2,11 @@
 Unit tests for drowcoder tools.
 """
 
+import sys
+from pathlib import Path
 
-
+# Add src to path once, for every tool test module; runs both under pytest and
+# when a module is run directly with python -m src.drowcoder.tools.tools.tests.test_<tool>
+SRC_PATH = str(Path(__file__).parent.parent.parent.parent.parent)
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
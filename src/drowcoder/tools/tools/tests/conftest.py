@@ -9,9 +9,8 @@ This module provides:
 import pytest
 import tempfile
 import shutil
-import subprocess
+from collections import Counter
 from pathlib import Path
-from datetime import datetime
 
 
 @pytest.fixture
@@ -33,42 +32,31 @@ def pytest_sessionfinish(session, exitstatus):
 
     This hook is called after all tests have been run and the session is about to finish.
     """
-    from .base import get_git_info, generate_report_name
+    from .base import get_git_info, generate_report_name, format_report_header
 
     # Get git info
     commit_sha, is_dirty, git_available = get_git_info()
 
-    # Determine tool name from test file
-    test_files = []
-    for item in session.items:
-        test_file = Path(item.fspath)
-        if test_file not in test_files:
-            test_files.append(test_file)
+    # Count tests per test file, in order of first appearance
+    test_counts = Counter(Path(item.fspath) for item in session.items)
 
     # Generate report for each test file
     reports_dir = Path(__file__).parent / 'reports'
     reports_dir.mkdir(exist_ok=True)
 
-    for test_file in test_files:
+    for test_file, test_count in test_counts.items():
         if test_file.stem.startswith('test_'):
             tool_name = test_file.stem.replace('test_', '')
             report_name = generate_report_name(tool_name, commit_sha, is_dirty)
             report_path = reports_dir / report_name
 
             # Create report header
-            header = f"""{'=' * 70}
-Test Report
-{'=' * 70}
-Tool: {tool_name}
-Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Git Commit: {commit_sha if git_available else 'N/A'}
-Working Dir: {'dirty (uncommitted changes)' if is_dirty else 'clean'}
-Exit Code: {exitstatus}
-Test File: {test_file.name}
-{'=' * 70}
-
-Test session completed.
-Total tests: {len([item for item in session.items if Path(item.fspath) == test_file])}
+            header = format_report_header(
+                tool_name, commit_sha, is_dirty, git_available, exitstatus,
+                extra=f"Test File: {test_file.name}\n",
+            )
+            header += f"""Test session completed.
+Total tests: {test_count}
 Exit status: {exitstatus}
 """
 
@@ -77,4 +65,3 @@ Exit status: {exitstatus}
                 f.write(header)
 
             print(f"\n📄 Report saved: {report_path}")
-
@@ -20,14 +20,13 @@ Usage:
 import pytest
 import sys
 import os
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 # Import from current unified tool structure
 from drowcoder.tools.tools.attempt_completion import AttemptCompletionTool, AttemptCompletionToolResponse
 
+# Prefix the tool puts in front of every completion result
+COMPLETION_PREFIX = "Task completed successfully: "
+
 # Helper function to maintain test compatibility
 def attempt_completion(result: str) -> str:
     """Wrapper function for testing - creates tool instance and calls execute"""
@@ -40,34 +39,40 @@ def attempt_completion(result: str) -> str:
         return f"Error: {result_obj.error}"
 
 
+@pytest.fixture(scope="module")
+def shared_tool():
+    """Create one default tool for tests that only call execute on it (it keeps no state)."""
+    return AttemptCompletionTool()
+
+
 class TestAttemptCompletionBasic:
     """Basic functionality tests."""
 
     def test_simple_string(self):
         """Test with simple string."""
         result = "Implemented new feature"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_empty_string(self):
         """Test with empty string."""
         result = ""
-        expected = "Task completed successfully: "
+        expected = COMPLETION_PREFIX
 
         assert attempt_completion(result) == expected
 
     def test_single_char(self):
         """Test with single character."""
         result = "X"
-        expected = "Task completed successfully: X"
+        expected = COMPLETION_PREFIX + "X"
 
         assert attempt_completion(result) == expected
 
     def test_whitespace_only(self):
         """Test with whitespace only."""
         result = "   "
-        expected = "Task completed successfully:    "
+        expected = COMPLETION_PREFIX + "   "
 
         assert attempt_completion(result) == expected
 
@@ -78,35 +83,35 @@ class TestAttemptCompletionEdgeCases:
     def test_very_long_string(self):
         """Test with very long string (10000 chars)."""
         result = "A" * 10000
-        expected = f"Task completed successfully: {'A' * 10000}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_special_characters(self):
         """Test with special characters."""
         result = "Fixed: @#$%^&*()_+-=[]{}|;':\",./<>?"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_newlines(self):
         """Test with newlines."""
         result = "Task 1\nTask 2\nTask 3"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_tabs(self):
         """Test with tabs."""
         result = "Item\t\tValue\t\tStatus"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_mixed_whitespace(self):
         """Test with mixed whitespace."""
         result = " \t\n\r  Mixed  \t\n  whitespace  \r\n "
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
@@ -117,28 +122,28 @@ class TestAttemptCompletionUnicode:
     def test_chinese_characters(self):
         """Test with Chinese characters."""
         result = "完成了功能实现"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_emoji(self):
         """Test with emoji."""
         result = "Feature complete 🎉 🚀 ✨"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_mixed_unicode(self):
         """Test with mixed unicode."""
         result = "Completed 完成 done ✓ успешно 成功"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_rtl_text(self):
         """Test with RTL (Right-to-Left) text."""
         result = "مكتمل successfully completed"
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
@@ -152,7 +157,7 @@ class TestAttemptCompletionFormatting:
 - Feature A
 - Feature B
 - Feature C"""
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
@@ -161,7 +166,7 @@ class TestAttemptCompletionFormatting:
         result = """1. First task
 2. Second task
 3. Third task"""
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
@@ -172,14 +177,14 @@ class TestAttemptCompletionFormatting:
 - Task 1
 ## Minor
 - Task 2"""
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
     def test_code_snippet(self):
         """Test with code snippet."""
         result = 'Fixed bug in function: def test():\n    return True'
-        expected = f"Task completed successfully: {result}"
+        expected = COMPLETION_PREFIX + result
 
         assert attempt_completion(result) == expected
 
@@ -193,15 +198,14 @@ class TestAttemptCompletionClass:
         assert tool is not None
         assert tool._initialized is True
 
-    def test_tool_execute_returns_result(self):
+    def test_tool_execute_returns_result(self, shared_tool):
         """Test tool execute returns AttemptCompletionToolResponse."""
-        tool = AttemptCompletionTool()
         from drowcoder.tools.tools.base import ToolResponseType
-        result = tool.execute(result="Test", as_type=ToolResponseType.INTACT)
+        result = shared_tool.execute(result="Test", as_type=ToolResponseType.INTACT)
 
         assert isinstance(result, AttemptCompletionToolResponse)
         assert result.success is True
-        assert "Task completed successfully: Test" in result.content
+        assert COMPLETION_PREFIX + "Test" in result.content
 
     def test_tool_with_logger(self):
         """Test tool with custom logger."""
@@ -236,11 +240,10 @@ class TestAttemptCompletionClass:
         with pytest.raises(RuntimeError, match="not initialized"):
             tool.execute(result="Test")
 
-    def test_tool_metadata(self):
+    def test_tool_metadata(self, shared_tool):
         """Test result contains tool_name."""
-        tool = AttemptCompletionTool()
         from drowcoder.tools.tools.base import ToolResponseType
-        result = tool.execute(result="Test", as_type=ToolResponseType.INTACT)
+        result = shared_tool.execute(result="Test", as_type=ToolResponseType.INTACT)
 
         assert result.tool_name == "attempt_completion"
         assert result.success is True
@@ -258,11 +261,20 @@ class TestAttemptCompletionParametrized:
         "Line 1\nLine 2\nLine 3",
         "Tab\t\tseparated",
         " Leading and trailing spaces ",
+    ], ids=[
+        "simple",
+        "empty",
+        "long",
+        "special",
+        "unicode",
+        "multiline",
+        "tabs",
+        "padded",
     ])
     def test_various_inputs(self, test_input):
         """Test attempt_completion with various inputs."""
         result = attempt_completion(test_input)
-        expected = f"Task completed successfully: {test_input}"
+        expected = COMPLETION_PREFIX + test_input
 
         assert result == expected
 
@@ -23,10 +23,6 @@ import sys
 import os
 import tempfile
 from pathlib import Path
-import time
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 # Import from current unified tool structure
 from drowcoder.tools.tools.bash import CmdResponse, BashTool
@@ -78,6 +74,12 @@ def tmp_path():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="module")
+def shared_tmp_path(tmp_path_factory):
+    """Create a temporary directory shared by tests that only run commands in it."""
+    return tmp_path_factory.mktemp("bash")
+
+
 class TestBashBasic:
     """Basic command execution tests."""
 
@@ -95,11 +97,11 @@ class TestBashBasic:
 
         assert result.exit_code == 42
 
-    def test_command_pwd(self, tmp_path):
+    def test_command_pwd(self, shared_tmp_path):
         """Test command in specific working directory."""
-        result = execute_command("pwd", cwd=str(tmp_path))
+        result = execute_command("pwd", cwd=str(shared_tmp_path))
 
-        assert str(tmp_path) in result.output
+        assert str(shared_tmp_path) in result.output
 
 
 class TestBashTimeout:
@@ -107,7 +109,9 @@ class TestBashTimeout:
 
     def test_timeout_command(self):
         """Test command that times out."""
-        result = execute_command("sleep 5", timeout_seconds=1)
+        # exec replaces the shell, so the kill on timeout reaches sleep itself; a
+        # sleep left running as the shell's child would hold the output open
+        result = execute_command("exec sleep 5", timeout_seconds=1)
 
         assert result.timed_out is True
 
@@ -153,11 +157,11 @@ class TestBashWorkingDirectory:
 
         assert "test content" in result.output
 
-    def test_cwd_with_pathlib(self, tmp_path):
+    def test_cwd_with_pathlib(self, shared_tmp_path):
         """Test with Path object as cwd."""
-        result = execute_command("pwd", cwd=tmp_path)
+        result = execute_command("pwd", cwd=shared_tmp_path)
 
-        assert str(tmp_path) in result.output
+        assert str(shared_tmp_path) in result.output
 
 
 class TestBashErrors:
@@ -257,12 +261,18 @@ class TestBashEdgeCases:
         assert "hello" in result.output and "world" in result.output
 
 
+@pytest.fixture(scope="module")
+def echo_result():
+    """Run one echo command whose result the result-property tests share."""
+    return execute_command("echo 'test'")
+
+
 class TestBashResultProperties:
     """Test CmdResponse properties."""
 
-    def test_result_has_required_fields(self):
+    def test_result_has_required_fields(self, echo_result):
         """Test that result has all required fields."""
-        result = execute_command("echo 'test'")
+        result = echo_result
 
         assert isinstance(result, CmdResponse)
         assert hasattr(result, 'cmd')
@@ -272,9 +282,9 @@ class TestBashResultProperties:
         assert hasattr(result, 'timed_out')
         assert hasattr(result, 'pid')
 
-    def test_result_to_dict(self):
+    def test_result_to_dict(self, echo_result):
         """Test CmdResponse.to_dict() method."""
-        result = execute_command("echo 'test'")
+        result = echo_result
 
         assert isinstance(result, CmdResponse)
         result_dict = result.to_dict()
@@ -282,9 +292,9 @@ class TestBashResultProperties:
         assert 'cmd' in result_dict
         assert 'exit_code' in result_dict
 
-    def test_result_to_pretty_str(self):
+    def test_result_to_pretty_str(self, echo_result):
         """Test CmdResponse.to_pretty_str() method."""
-        result = execute_command("echo 'test'")
+        result = echo_result
 
         assert isinstance(result, CmdResponse)
         pretty_str = result.to_pretty_str()
@@ -23,12 +23,7 @@ Usage:
 import pytest
 import sys
 import os
-import tempfile
 import re
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
 
 # Import from current unified tool structure
 from drowcoder.tools.tools.search import SearchTool, SearchToolResponse, FileMatchMeta, LineMeta
@@ -43,84 +38,76 @@ def search(path, content_pattern, filepath_pattern="*", **kwargs):
     return result.content if result.success else result.error
 
 
-@pytest.fixture
-def tmp_path():
-    """Create a temporary directory for test files."""
-    temp_dir = tempfile.mkdtemp()
-    yield Path(temp_dir)
-    # Cleanup
-    import shutil
-    shutil.rmtree(temp_dir, ignore_errors=True)
-
-
-@pytest.fixture
-def test_files(tmp_path):
-    """Create test files with various content."""
-    files = {}
-
+# Shared corpus for the read-only search tests: file name -> content
+CORPUS_FILES = {
     # Python file with TODO
-    files['test.py'] = tmp_path / "test.py"
-    files['test.py'].write_text("""# Test file
+    'test.py': """# Test file
 def hello():
     print("Hello")
     # TODO: Add more features
     return True
-""")
-
+""",
     # Text file with keywords
-    files['test.txt'] = tmp_path / "test.txt"
-    files['test.txt'].write_text("""Line 1: Search term
+    'test.txt': """Line 1: Search term
 Line 2: Another line
 Line 3: Search term again
-""")
-
+""",
     # File with special characters
-    files['special.txt'] = tmp_path / "special.txt"
-    files['special.txt'].write_text("""Special: !@#$%^&*()
+    'special.txt': """Special: !@#$%^&*()
 Unicode: 中文 日本語
-""")
-
+""",
     # Empty file
-    files['empty.txt'] = tmp_path / "empty.txt"
-    files['empty.txt'].write_text("")
-
+    'empty.txt': "",
     # File with many lines
-    files['many_lines.txt'] = tmp_path / "many_lines.txt"
-    files['many_lines.txt'].write_text("\n".join([f"Line {i}: content" for i in range(100)]))
+    'many_lines.txt': "\n".join([f"Line {i}: content" for i in range(100)]),
+}
+
+
+@pytest.fixture(scope="module")
+def corpus_dir(tmp_path_factory):
+    """Create the test files once per module; tests must not modify them."""
+    base = tmp_path_factory.mktemp("search_corpus")
+    for name, content in CORPUS_FILES.items():
+        (base / name).write_text(content)
+    return base
+
 
-    return files
+@pytest.fixture(scope="module")
+def test_files(corpus_dir):
+    """Map each corpus file name to its path."""
+    return {name: corpus_dir / name for name in CORPUS_FILES}
 
 
 class TestSearchBasic:
     """Basic search functionality tests."""
 
-    def test_simple_search(self, tmp_path, test_files):
+    def test_simple_search(self, tmp_path):
         """Test simple content search."""
-        test_files['test.txt'].write_text("Search term here")
+        (tmp_path / "test.txt").write_text("Search term here")
 
         result = search(str(tmp_path), "Search term", "*", cwd=str(tmp_path))
 
         assert isinstance(result, str)
         assert "test.txt" in result or "Search term" in result
 
-    def test_regex_pattern(self, tmp_path, test_files):
+    def test_regex_pattern(self, corpus_dir, test_files):
         """Test regex pattern matching."""
-        result = search(str(tmp_path), "def\\s+\\w+", "*.py", cwd=str(tmp_path))
+        result = search(str(corpus_dir), "def\\s+\\w+", "*.py", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
         assert "def" in result.lower() or "No matching" in result
 
-    def test_file_pattern_filtering(self, tmp_path, test_files):
+    def test_file_pattern_filtering(self, corpus_dir, test_files):
         """Test file pattern filtering."""
-        result = search(str(tmp_path), ".*", "*.py", cwd=str(tmp_path))
+        result = search(str(corpus_dir), ".*", "*.py", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
         # Should only find Python files
         assert "test.txt" not in result or "No matching" in result
 
-    def test_search_in_single_file(self, tmp_path, test_files):
+    def test_search_in_single_file(self, corpus_dir, test_files):
         """Test searching in a single file."""
-        result = search(str(test_files['test.py']), "TODO", "*", cwd=str(tmp_path))
+        result = search(str(test_files['test.py']), "TODO", "*", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
         assert "TODO" in result or "No matching" in result
@@ -129,39 +116,39 @@ class TestSearchBasic:
 class TestSearchOutputFormats:
     """Test different output formats."""
 
-    def test_text_format(self, tmp_path, test_files):
+    def test_text_format(self, corpus_dir, test_files):
         """Test text output format."""
         result = search(
-            str(tmp_path),
+            str(corpus_dir),
             "Search term",
             "*",
-            cwd=str(tmp_path),
+            cwd=str(corpus_dir),
             as_text=True,
             as_graph=False
         )
 
         assert isinstance(result, str)
 
-    def test_graph_format(self, tmp_path, test_files):
+    def test_graph_format(self, corpus_dir, test_files):
         """Test graph output format."""
         result = search(
-            str(tmp_path),
+            str(corpus_dir),
             ".*",
             "*",
-            cwd=str(tmp_path),
+            cwd=str(corpus_dir),
             as_text=True,
             as_graph=True
         )
 
         assert isinstance(result, str)
 
-    def test_raw_results(self, tmp_path, test_files):
+    def test_raw_results(self, corpus_dir, test_files):
         """Test raw results format."""
         result = search(
-            str(tmp_path),
+            str(corpus_dir),
             "Search term",
             "*",
-            cwd=str(tmp_path),
+            cwd=str(corpus_dir),
             as_text=False,
             as_graph=False
         )
@@ -170,13 +157,13 @@ class TestSearchOutputFormats:
         if result:
             assert isinstance(result[0], FileMatchMeta)
 
-    def test_only_filename(self, tmp_path, test_files):
+    def test_only_filename(self, corpus_dir, test_files):
         """Test only_filename option."""
         result = search(
-            str(tmp_path),
+            str(corpus_dir),
             ".*",
             "*",
-            cwd=str(tmp_path),
+            cwd=str(corpus_dir),
             only_filename=True
         )
 
@@ -187,50 +174,70 @@ class TestSearchOutputFormats:
 class TestSearchEdgeCases:
     """Edge case tests."""
 
-    def test_empty_results(self, tmp_path, test_files):
+    def test_empty_results(self, corpus_dir, test_files):
         """Test search with no matches."""
-        result = search(str(tmp_path), "NonExistentPattern123", "*", cwd=str(tmp_path))
+        result = search(str(corpus_dir), "NonExistentPattern123", "*", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
         assert "No matching" in result or "0 files" in result.lower()
 
-    def test_empty_file(self, tmp_path, test_files):
+    def test_empty_file(self, corpus_dir, test_files):
         """Test searching in empty file."""
-        result = search(str(test_files['empty.txt']), ".*", "*", cwd=str(tmp_path))
+        result = search(str(test_files['empty.txt']), ".*", "*", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
         assert "No matching" in result or "0 files" in result.lower()
 
-    def test_pattern_matching_all_lines(self, tmp_path, test_files):
+    def test_pattern_matching_all_lines(self, corpus_dir, test_files):
         """Test pattern that matches all lines."""
-        result = search(str(tmp_path), ".*", "*", cwd=str(tmp_path))
+        result = search(str(corpus_dir), ".*", "*", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
         # Should find files with matches
 
-    def test_case_sensitive_search(self, tmp_path, test_files):
+    def test_case_sensitive_search(self, tmp_path):
         """Test case sensitive search."""
-        test_files['case.txt'] = tmp_path / "case.txt"
-        test_files['case.txt'].write_text("Hello World\nhello world")
+        case_file = tmp_path / "case.txt"
+        case_file.write_text("Hello World\nhello world")
 
         result = search(str(tmp_path), "Hello", "*", cwd=str(tmp_path))
 
         assert isinstance(result, str)
         # Should find case-sensitive matches
 
+    def test_non_utf8_file_is_reported(self, tmp_path, caplog):
+        """Test that a non-UTF-8 file without the literal is still reported as unreadable."""
+        (tmp_path / "latin1.txt").write_bytes("caf\xe9".encode("latin-1"))
+        import logging
+        tool = SearchTool(logger=logging.getLogger("test_search_non_utf8"))
+
+        from drowcoder.tools.tools.base import ToolResponseType
+        with caplog.at_level(logging.WARNING):
+            result = tool.execute(
+                path=str(tmp_path),
+                content_pattern="NonExistentPattern123",
+                filepath_pattern="*",
+                cwd=str(tmp_path),
+                as_type=ToolResponseType.INTACT
+            )
+
+        assert result.success is True
+        assert "Error reading file" in caplog.text
+        assert "latin1.txt" in caplog.text
+
 
 class TestSearchUnicode:
     """Unicode and special character tests."""
 
-    def test_unicode_content(self, tmp_path, test_files):
+    def test_unicode_content(self, corpus_dir, test_files):
         """Test searching Unicode content."""
-        result = search(str(tmp_path), "中文", "*", cwd=str(tmp_path))
+        result = search(str(corpus_dir), "中文", "*", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
 
-    def test_special_characters(self, tmp_path, test_files):
+    def test_special_characters(self, corpus_dir, test_files):
         """Test searching special characters."""
-        result = search(str(tmp_path), "!@#", "*", cwd=str(tmp_path))
+        result = search(str(corpus_dir), "!@#", "*", cwd=str(corpus_dir))
 
         assert isinstance(result, str)
 
@@ -254,11 +261,11 @@ class TestSearchErrors:
         assert isinstance(result, str)
         assert "does not exist" in result.lower() or "not found" in result.lower()
 
-    def test_invalid_regex(self, tmp_path, test_files):
+    def test_invalid_regex(self, corpus_dir, test_files):
         """Test with invalid regex pattern."""
         # Some invalid regex patterns might raise errors
         try:
-            result = search(str(tmp_path), "[", "*", cwd=str(tmp_path))
+            result = search(str(corpus_dir), "[", "*", cwd=str(corpus_dir))
             # If no error, should return a result
             assert isinstance(result, str)
         except re.error:
@@ -322,23 +329,23 @@ class TestSearchToolClass:
             assert tool is not None
             assert tool._initialized is True
 
-    def test_tool_execute_returns_result(self, tmp_path, test_files):
+    def test_tool_execute_returns_result(self, corpus_dir, test_files):
         """Test that tool.execute() returns SearchToolResponse."""
         if SearchTool and SearchToolResponse:
             tool = SearchTool()
             from drowcoder.tools.tools.base import ToolResponseType
             result = tool.execute(
-                path=str(tmp_path),
+                path=str(corpus_dir),
                 content_pattern=".*",
                 filepath_pattern="*",
-                cwd=str(tmp_path),
+                cwd=str(corpus_dir),
                 as_type=ToolResponseType.INTACT
             )
 
             assert isinstance(result, SearchToolResponse)
             assert result.success is True
 
-    def test_tool_with_logger(self, tmp_path, test_files):
+    def test_tool_with_logger(self, corpus_dir, test_files):
         """Test tool with custom logger."""
         if SearchTool:
             import logging
@@ -347,16 +354,16 @@ class TestSearchToolClass:
 
             from drowcoder.tools.tools.base import ToolResponseType
             result = tool.execute(
-                path=str(tmp_path),
+                path=str(corpus_dir),
                 content_pattern=".*",
                 filepath_pattern="*",
-                cwd=str(tmp_path),
+                cwd=str(corpus_dir),
                 as_type=ToolResponseType.INTACT
             )
 
             assert result.success is True
 
-    def test_tool_with_callback(self, tmp_path, test_files):
+    def test_tool_with_callback(self, corpus_dir, test_files):
         """Test tool with callback function."""
         if SearchTool:
             callback_called = []
@@ -367,10 +374,10 @@ class TestSearchToolClass:
             tool = SearchTool(callback=test_callback)
             from drowcoder.tools.tools.base import ToolResponseType
             result = tool.execute(
-                path=str(tmp_path),
+                path=str(corpus_dir),
                 content_pattern=".*",
                 filepath_pattern="*",
-                cwd=str(tmp_path),
+                cwd=str(corpus_dir),
                 as_type=ToolResponseType.INTACT
             )
 
@@ -389,16 +396,16 @@ class TestSearchToolClass:
                     filepath_pattern="*"
                 )
 
-    def test_tool_metadata(self, tmp_path, test_files):
+    def test_tool_metadata(self, corpus_dir, test_files):
         """Test result contains metadata."""
         if SearchTool and SearchToolResponse:
             tool = SearchTool()
             from drowcoder.tools.tools.base import ToolResponseType
             result = tool.execute(
-                path=str(tmp_path),
+                path=str(corpus_dir),
                 content_pattern=".*",
                 filepath_pattern="*",
-                cwd=str(tmp_path),
+                cwd=str(corpus_dir),
                 as_type=ToolResponseType.INTACT
             )
 
@@ -410,32 +417,32 @@ class TestSearchToolClass:
 class TestSearchResultProperties:
     """Test SearchToolResponse properties."""
 
-    def test_result_files_found(self, tmp_path, test_files):
+    def test_result_files_found(self, corpus_dir, test_files):
         """Test files_found property."""
         if SearchTool and SearchToolResponse:
             tool = SearchTool()
             from drowcoder.tools.tools.base import ToolResponseType
             result = tool.execute(
-                path=str(tmp_path),
+                path=str(corpus_dir),
                 content_pattern=".*",
                 filepath_pattern="*",
-                cwd=str(tmp_path),
+                cwd=str(corpus_dir),
                 as_type=ToolResponseType.INTACT
             )
 
             assert hasattr(result.metadata, 'files_found')
             assert result.metadata.files_found >= 0
 
-    def test_result_total_matches(self, tmp_path, test_files):
+    def test_result_total_matches(self, corpus_dir, test_files):
         """Test total_matches property."""
         if SearchTool and SearchToolResponse:
             tool = SearchTool()
             from drowcoder.tools.tools.base import ToolResponseType
             result = tool.execute(
-                path=str(tmp_path),
+                path=str(corpus_dir),
                 content_pattern=".*",
                 filepath_pattern="*",
-                cwd=str(tmp_path),
+                cwd=str(corpus_dir),
                 as_type=ToolResponseType.INTACT
             )
 
@@ -484,20 +491,15 @@ class TestSearchParametrized:
         "import",
         "\\d+",
     ])
-    def test_various_patterns(self, tmp_path, test_files, pattern):
-        """Test search with various patterns."""
-        result = search(str(tmp_path), pattern, "*", cwd=str(tmp_path))
-        assert isinstance(result, str)
-
     @pytest.mark.parametrize("file_pattern", [
         "*.py",
         "*.txt",
         "*",
         "test.*",
     ])
-    def test_various_file_patterns(self, tmp_path, test_files, file_pattern):
-        """Test search with various file patterns."""
-        result = search(str(tmp_path), ".*", file_pattern, cwd=str(tmp_path))
+    def test_pattern_matrix(self, corpus_dir, pattern, file_pattern):
+        """Test search with each content pattern against each file pattern."""
+        result = search(str(corpus_dir), pattern, file_pattern, cwd=str(corpus_dir))
         assert isinstance(result, str)
 
 
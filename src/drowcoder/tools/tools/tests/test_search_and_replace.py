@@ -26,9 +26,6 @@ import os
 import tempfile
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 # Import from current unified tool structure
 from drowcoder.tools.tools.search_and_replace import SearchAndReplaceTool, SearchAndReplaceToolResponse
 
@@ -97,6 +94,108 @@ class TestSearchAndReplaceBasic:
         # File should remain unchanged
         assert test_file.read_text() == original_content
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permission bits")
+    def test_apply_preserves_file_mode(self, test_file):
+        """Test apply keeps the file's permissions and leaves no temporary file."""
+        test_file.chmod(0o750)
+
+        search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified Line 2",
+            mode="apply"
+        )
+
+        assert "Modified Line 2" in test_file.read_text()
+        assert test_file.stat().st_mode & 0o777 == 0o750
+        assert sorted(p.name for p in test_file.parent.iterdir()) == [test_file.name]
+
+    @pytest.mark.skipif(os.name == "nt" or os.geteuid() == 0, reason="POSIX permissions, not as root")
+    def test_apply_refuses_read_only_file(self, test_file):
+        """Test apply does not overwrite a file the caller may not write."""
+        original_content = test_file.read_text()
+        test_file.chmod(0o444)
+
+        result = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified Line 2",
+            mode="apply"
+        )
+
+        assert not result.success
+        assert "Permission denied" in result.error
+        assert test_file.read_text() == original_content
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX hard links")
+    def test_apply_keeps_hard_links(self, test_file):
+        """Test apply writes a hard-linked file in place, so its links still share it."""
+        link = test_file.parent / "link.txt"
+        os.link(test_file, link)
+
+        search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified Line 2",
+            mode="apply"
+        )
+
+        assert "Modified Line 2" in link.read_text()
+        assert os.path.samefile(test_file, link)
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX hard links")
+    def test_apply_streamed_file_with_hard_link(self, test_file, monkeypatch):
+        """Test apply on a streamed, hard-linked file rewrites it in place without losing content."""
+        from drowcoder.tools.tools import search_and_replace as module
+        monkeypatch.setattr(module, "STREAMING_THRESHOLD", 0)
+        link = test_file.parent / "link.txt"
+        os.link(test_file, link)
+        expected = test_file.read_text().replace("Line 2\n", "Modified Line 2\n")
+
+        result = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified Line 2",
+            mode="apply"
+        )
+
+        assert result.success
+        assert link.read_text() == expected
+        assert os.path.samefile(test_file, link)
+
+    def test_apply_streamed_file(self, test_file, monkeypatch):
+        """Test apply on a file streamed during the search gives the same content."""
+        from drowcoder.tools.tools import search_and_replace as module
+        monkeypatch.setattr(module, "STREAMING_THRESHOLD", 0)
+        expected = test_file.read_text().replace("Line 2\n", "Modified\nLine 2b\n")
+
+        result = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified\nLine 2b",
+            mode="apply"
+        )
+
+        assert result.total_matches == 1
+        assert test_file.read_text() == expected
+
+    def test_streamed_file_without_search_text(self, test_file, monkeypatch):
+        """Test a streamed file ruled out by its memory map has no matches."""
+        from drowcoder.tools.tools import search_and_replace as module
+        monkeypatch.setattr(module, "STREAMING_THRESHOLD", 0)
+        original = test_file.read_text()
+
+        result = search_and_replace(
+            str(test_file),
+            "NonExistent Line",
+            "Replacement",
+            mode="apply"
+        )
+
+        assert result.success
+        assert result.total_matches == 0
+        assert test_file.read_text() == original
+
     def test_no_matches(self, test_file):
         """Test when no matches are found."""
         result = search_and_replace(
@@ -264,6 +363,23 @@ class TestSearchAndReplaceCaseSensitivity:
         # All variations should be replaced
         assert content.count("Hi") >= 1
 
+    def test_case_insensitive_casefold(self, tmp_path):
+        """Test case insensitive search folds characters without a simple lowercase."""
+        test_file = tmp_path / "casefold.txt"
+        test_file.write_text("STRASSE\nstraße\nstreet", encoding="utf-8")
+
+        result = search_and_replace(
+            str(test_file),
+            "Straße",
+            "road",
+            mode="apply",
+            case_sensitive=False
+        )
+
+        assert result.total_matches == 2
+        content = test_file.read_text(encoding="utf-8")
+        assert content == "road\nroad\nstreet"
+
 
 class TestSearchAndReplaceEdgeCases:
     """Edge case tests."""
@@ -399,6 +515,26 @@ class TestSearchAndReplaceToolClass:
 
             assert result is not None
 
+    def test_tool_preview_with_info_disabled(self, test_file):
+        """Test preview still reports its matches when the logger drops INFO."""
+        if SearchAndReplaceTool:
+            import logging
+            from drowcoder.tools.tools.base import ToolResponseType
+            logger = logging.getLogger("test_logger_quiet")
+            logger.setLevel(logging.WARNING)
+            tool = SearchAndReplaceTool(logger=logger)
+
+            result = tool.execute(
+                file=str(test_file),
+                search="Line 2",
+                replace="Modified",
+                mode="preview",
+                as_type=ToolResponseType.INTACT
+            )
+
+            assert result.total_matches == 1
+            assert result.content == "Preview completed: 1 files with matches, 1 total matches"
+
     def test_tool_with_callback(self, test_file):
         """Test tool with callback function."""
         if SearchAndReplaceTool:
@@ -474,6 +610,39 @@ class TestSearchAndReplaceResultProperties:
         if hasattr(result, 'total_files_with_matches'):
             assert result.total_files_with_matches >= 0
 
+    def test_result_to_dict(self, test_file):
+        """Test to_dict gives dataclasses.asdict without the scan bookkeeping."""
+        from dataclasses import asdict
+        result = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified\nLine 2b",
+            mode="preview"
+        )
+
+        expected = asdict(result)
+        for file_response in expected['file_responses']:
+            del file_response['cached_content'], file_response['scanned_signature']
+
+        assert result.total_matches == 1
+        assert result.to_dict() == expected
+
+    def test_content_kept_only_for_files_with_matches(self, tmp_path):
+        """Test that files without matches do not keep their content in the response."""
+        (tmp_path / "match.txt").write_text("Match line")
+        (tmp_path / "other.txt").write_text("Other line")
+
+        result = search_and_replace(
+            str(tmp_path),
+            "Match line",
+            "Replaced line",
+            mode="preview",
+            file_pattern="*.txt"
+        )
+
+        cached = {Path(fr.file_path).name: fr.cached_content for fr in result.file_responses}
+        assert cached == {"match.txt": "Match line", "other.txt": None}
+
 
 class TestSearchAndReplaceDirectory:
     """Test directory search and replace."""
@@ -494,6 +663,172 @@ class TestSearchAndReplaceDirectory:
 
         assert result is not None
 
+    def test_search_in_directory_skips_ignored_directories(self, tmp_path):
+        """Test that version control and cache directories are not searched."""
+        (tmp_path / "file.txt").write_text("Match line")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config.txt").write_text("Match line")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.txt").write_text("Match line")
+
+        result = search_and_replace(
+            str(tmp_path),
+            "Match line",
+            "Replaced line",
+            mode="apply",
+            file_pattern="*.txt"
+        )
+
+        assert result.total_matches == 1
+        assert (tmp_path / "file.txt").read_text() == "Replaced line"
+        assert (tmp_path / ".git" / "config.txt").read_text() == "Match line"
+        assert (tmp_path / "node_modules" / "dep.txt").read_text() == "Match line"
+
+    def test_search_in_directory_with_process_pool(self, tmp_path, monkeypatch, request):
+        """Test that scanning files in the shared worker pool finds the same matches."""
+        from drowcoder.tools.tools import search_and_replace as module
+        request.addfinalizer(module._shutdown_process_pool)
+        monkeypatch.setattr(module, "PROCESS_POOL_MIN_BYTES", 0)
+        monkeypatch.setattr(module.os, "cpu_count", lambda: 2)
+        (tmp_path / "file1.txt").write_text("Match line\nother")
+        (tmp_path / "file2.txt").write_text("other\nMatch line")
+
+        result = search_and_replace(
+            str(tmp_path),
+            "Match line",
+            "Replaced line",
+            mode="apply",
+            file_pattern="*.txt"
+        )
+
+        assert result.total_matches == 2
+        assert (tmp_path / "file1.txt").read_text() == "Replaced line\nother"
+        assert (tmp_path / "file2.txt").read_text() == "other\nReplaced line"
+
+        # Later scans reuse the same pool
+        pool = module._process_pool
+        assert pool is not None
+        result = search_and_replace(
+            str(tmp_path),
+            "Replaced line",
+            "Match line",
+            mode="preview",
+            file_pattern="*.txt"
+        )
+        assert result.total_matches == 2
+        assert module._process_pool is pool
+
+
+class TestSearchAndReplaceApplyResponse:
+    """Test applying a previewed response."""
+
+    def test_apply_previewed_response(self, test_file):
+        """Test that a preview can be applied without searching again."""
+        preview = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified",
+            mode="preview"
+        )
+        assert "Line 2" in test_file.read_text()
+
+        tool = SearchAndReplaceTool()
+        from drowcoder.tools.tools.base import ToolResponseType
+        result = tool.apply_response(preview, as_type=ToolResponseType.INTACT)
+
+        assert result.success
+        content = test_file.read_text()
+        assert "Modified" in content
+        assert "Line 2" not in content
+
+    def test_apply_skips_changed_file(self, test_file):
+        """Test that a file modified after the preview is not overwritten."""
+        preview = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified",
+            mode="preview"
+        )
+
+        test_file.write_text("Line 2\nEdited elsewhere\n")
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        tool = SearchAndReplaceTool()
+        from drowcoder.tools.tools.base import ToolResponseType
+        result = tool.apply_response(preview, as_type=ToolResponseType.INTACT)
+
+        assert not result.success
+        assert "changed since it was searched" in result.error
+        assert test_file.read_text() == "Line 2\nEdited elsewhere\n"
+
+    def test_apply_skips_file_changed_within_mtime(self, test_file):
+        """Test that a file rewritten with its old mtime restored is not overwritten."""
+        preview = search_and_replace(
+            str(test_file),
+            "Line 2",
+            "Modified",
+            mode="preview"
+        )
+
+        stat = test_file.stat()
+        test_file.write_text("Line 2\nEdited elsewhere\n")
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert test_file.stat().st_mtime_ns == stat.st_mtime_ns
+
+        tool = SearchAndReplaceTool()
+        from drowcoder.tools.tools.base import ToolResponseType
+        result = tool.apply_response(preview, as_type=ToolResponseType.INTACT)
+
+        assert not result.success
+        assert "changed since it was searched" in result.error
+        assert test_file.read_text() == "Line 2\nEdited elsewhere\n"
+
+
+class TestSearchAndReplaceFileCache:
+    """Test the content cache shared by searches."""
+
+    def test_cache_keys_on_resolved_path(self, test_file):
+        """Test that one file reached through two paths is cached once."""
+        from drowcoder.tools.tools import search_and_replace as module
+        module._clear_file_cache()
+        (test_file.parent / "sub").mkdir()
+
+        first = module._read_file(str(test_file))
+        second = module._read_file(str(test_file.parent / "sub" / ".." / test_file.name))
+
+        assert first == second == test_file.read_text()
+        assert len(module._file_cache) == 1
+
+    def test_cache_size_limits(self, tmp_path, monkeypatch):
+        """Test that large files are not cached and the cache evicts to its byte budget."""
+        from drowcoder.tools.tools import search_and_replace as module
+        module._clear_file_cache()
+        monkeypatch.setattr(module, "FILE_CACHE_MAX_FILE_BYTES", 8)
+        monkeypatch.setattr(module, "FILE_CACHE_MAX_BYTES", 10)
+        (tmp_path / "large.txt").write_text("x" * 9)
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (tmp_path / name).write_text(name)
+
+        assert module._read_file(tmp_path / "large.txt") == "x" * 9
+        for name in ("a.txt", "b.txt", "c.txt"):
+            assert module._read_file(tmp_path / name) == name
+
+        # Only the two most recent small files fit in 10 bytes
+        assert [Path(path).name for path, _ in module._file_cache] == ["b.txt", "c.txt"]
+        assert module._file_cache_bytes == 10
+
+    def test_process_pool_worker_skips_cache(self, test_file, monkeypatch):
+        """Test that a process pool worker reads files without caching them."""
+        from drowcoder.tools.tools import search_and_replace as module
+        module._clear_file_cache()
+        monkeypatch.setattr(module, "_file_cache_enabled", True)
+
+        module._init_process_pool_worker()
+
+        assert module._read_file(test_file) == test_file.read_text()
+        assert len(module._file_cache) == 0
+
 
 class TestSearchAndReplaceParametrized:
     """Parametrized tests for various inputs."""
@@ -27,9 +27,6 @@ import json
 import time
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 # Import from current unified tool structure
 from drowcoder.tools.tools.todo import TodoTool, TodoToolResponse, TodoItem, TodoStatusType
 
@@ -25,9 +25,6 @@ import os
 import tempfile
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent))
-
 # Import from current unified tool structure
 from drowcoder.tools.tools.write import WriteTool, WriteToolResponse
 